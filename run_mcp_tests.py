@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Run an MCP test scenario from a JSON spec against the Slunk server
+
+    ./run_mcp_tests.py --spec tests/specs/all_mcp_tools.json [--binary DEBUG]
+
+A spec is an object with a `title`, an optional `pipeline` flag (send every
+request in one write instead of one at a time) and a list of `cases`. Each
+case gives a `title`, the JSON-RPC `method` and `params`, and a `report`
+naming how its response is printed (see REPORTERS).
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from slunk_mcp_client import MCP_SERVER_PATHS, McpClient, dumps, encode_request
+
+SPEC_DIR = Path(__file__).resolve().parent / "tests" / "specs"
+
+def report_server_info(response):
+    """Server name and version from an initialize response"""
+    if response and 'result' in response:
+        server_info = response['result']['serverInfo']
+        print(f"✓ Server: {server_info['name']} v{server_info['version']}")
+    else:
+        print(f"✗ Failed to initialize: {response}")
+
+def report_tools(response):
+    """Tool names from a tools/list response"""
+    if response is None:
+        print("✗ No response received for tools/list")
+    elif 'error' in response:
+        print(f"✗ Error in tools/list: {response['error']}")
+    elif 'result' not in response:
+        print(f"✗ Unexpected response format: {response}")
+    else:
+        tools = response['result']['tools']
+        print(f"✓ Found {len(tools)} tools:")
+        for tool in tools:
+            print(f"  - {tool['name']}")
+
+def report_preview(response):
+    """Pass/fail plus the first 100 chars of a tool's text"""
+    if response and 'result' in response:
+        print("✓ Responded successfully")
+        if 'content' in response['result'] and len(response['result']['content']) > 0:
+            content = response['result']['content'][0]
+            if content['type'] == 'text':
+                # Show first 100 chars of response
+                text = content['text']
+                preview = text[:100] + "..." if len(text) > 100 else text
+                print(f"  Response preview: {preview}")
+    elif response and 'error' in response:
+        print(f"✗ Returned error: {response['error']}")
+    else:
+        print("✗ Failed to respond")
+
+def report_text(response):
+    """A tool's text content, or a truncated dump if the response has none"""
+    try:
+        content = response["result"]["content"][0]["text"]
+    except (TypeError, KeyError, IndexError):
+        # Unexpected shape: a compact dump is enough to see what came back
+        print(f"Full response: {dumps(response)[:500].decode(errors='replace')}\n")
+        return
+    print(f"Results:\n{content}\n")
+
+REPORTERS = {
+    "server_info": report_server_info,
+    "tools": report_tools,
+    "preview": report_preview,
+    "text": report_text,
+}
+
+def load_spec(path):
+    """Load a spec and encode the JSON-RPC request for each case
+
+    Every request in a spec is a constant, so each is serialized once here
+    and the encoded frames are written as-is when the spec runs.
+    """
+    with open(path) as f:
+        spec = json.load(f)
+
+    frames = []
+    for request_id, case in enumerate(spec['cases'], start=1):
+        if case['report'] not in REPORTERS:
+            raise ValueError(f"{path}: unknown report {case['report']!r} in case {request_id}")
+        frames.append(encode_request({
+            "jsonrpc": "2.0",
+            "method": case['method'],
+            "params": case.get('params', {}),
+            "id": request_id
+        }))
+    return spec, frames
+
+def report(case, request_id, response):
+    """Print one case's response with the reporter its spec names"""
+    print(f"\n{request_id}. {case['title']}...")
+    REPORTERS[case['report']](response)
+
+async def run_spec(spec, frames, server_path):
+    """Run every case of a spec through one server and print the results"""
+    print(f"=== {spec['title']} ===")
+
+    cases = list(zip(spec['cases'], frames))
+    async with McpClient(server_path) as client:
+        responses = []
+        try:
+            if spec.get('pipeline'):
+                responses = await client.send_raw(frames)
+                for (case, (request_id, _)), response in zip(cases, responses):
+                    report(case, request_id, response)
+            else:
+                for case, frame in cases:
+                    request_id, _ = frame
+                    [response] = await client.send_raw([frame])
+                    responses.append(response)
+                    report(case, request_id, response)
+        finally:
+            # Show what the server was saying if any request went unanswered
+            if len(responses) < len(cases) or None in responses:
+                for line in client.drain_stderr():
+                    print("[STDERR]", line)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--spec", required=True, type=Path, help="JSON scenario to run")
+    parser.add_argument("--binary", choices=sorted(MCP_SERVER_PATHS), default="RELEASE",
+                        help="Xcode build configuration to launch (default: RELEASE)")
+    args = parser.parse_args(argv)
+
+    spec, frames = load_spec(args.spec)
+    try:
+        asyncio.run(run_spec(spec, frames, MCP_SERVER_PATHS[args.binary]))
+    except Exception as e:
+        print(f"Error during testing: {e!r}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
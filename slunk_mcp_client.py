@@ -0,0 +1,225 @@
+"""
+Shared MCP client for the Slunk test drivers
+"""
+
+import asyncio
+import collections
+import os
+
+try:
+    import orjson
+
+    dumps = orjson.dumps
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+
+    def dumps(obj):
+        """Serialize to compact UTF-8 bytes, matching orjson.dumps"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+_PRODUCTS_DIR = "/Users/junekim/Library/Developer/Xcode/DerivedData/slunk-swift-hbeqpnnlvrrmfkftkscwaikwwclb/Build/Products"
+
+# Server binary for each Xcode build configuration
+MCP_SERVER_PATHS = {
+    "RELEASE": f"{_PRODUCTS_DIR}/Release/slunk-swift.app/Contents/MacOS/slunk-swift",
+    "DEBUG": f"{_PRODUCTS_DIR}/Debug/slunk-swift.app/Contents/MacOS/slunk-swift",
+}
+MCP_SERVER_PATH = MCP_SERVER_PATHS["RELEASE"]
+
+# Last line slunk_swiftApp.runMCPServer writes to stderr once the read loop is up
+READY_MARKER = b"[MCP] Server started successfully"
+
+# Where server stderr is appended when MCP_DEBUG is set
+DEBUG_LOG_PATH = "mcp.log"
+
+# Recent stderr lines kept in memory for printing when something fails
+STDERR_TAIL_LINES = 50
+
+def encode_request(request):
+    """Encode a request once into its (request_id, newline-terminated frame)
+
+    Requests that never change can be encoded up front and replayed with
+    McpClient.send_raw, skipping serialization on the send path.
+    """
+    return request["id"], dumps(request) + b"\n"
+
+class McpClient:
+    """One long-lived `slunk-swift --mcp` process, reused for every request
+
+    Use as `async with McpClient() as client: await client.send(request)`.
+    Responses are matched to requests by JSON-RPC id, so concurrent and
+    pipelined sends over the same pipe are safe.
+
+    Server stderr goes to /dev/null unless `debug` (default: the MCP_DEBUG
+    environment variable) is set, in which case it is appended to
+    DEBUG_LOG_PATH and the client waits for the startup banner. Without it
+    the first response doubles as the readiness signal: requests written
+    early simply sit in the pipe until the server's read loop starts.
+    """
+
+    def __init__(self, path=MCP_SERVER_PATH, ready_timeout=10, request_timeout=15, debug=None):
+        self.path = path
+        self.ready_timeout = ready_timeout
+        self.request_timeout = request_timeout
+        self.debug = bool(os.environ.get("MCP_DEBUG")) if debug is None else debug
+        self.proc = None
+        self._log = None
+        self._stderr_tail = collections.deque(maxlen=STDERR_TAIL_LINES)
+        self._ready = None
+        self._pending = {}
+        self._out = bytearray()
+        self._stderr_task = None
+        self._reader = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def start(self):
+        """Spawn the server, waiting for its startup banner in debug mode"""
+        self.proc = await asyncio.create_subprocess_exec(
+            self.path, "--mcp",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE if self.debug else asyncio.subprocess.DEVNULL,
+            # Headroom for long stderr lines; stdout is framed by hand
+            limit=1 << 20
+        )
+
+        if self.debug:
+            self._log = open(DEBUG_LOG_PATH, "ab")
+            self._ready = asyncio.Event()
+            self._stderr_task = asyncio.create_task(self._drain_stderr())
+
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=self.ready_timeout)
+                if self._stderr_task.done():
+                    # Nothing downstream gets to print the tail; carry it here
+                    stderr = "\n".join(self.drain_stderr())
+                    raise RuntimeError(f"MCP server exited before it was ready\n{stderr}")
+            except BaseException:
+                await self.close()
+                raise
+
+        self._reader = asyncio.create_task(self._read_responses())
+
+    async def _drain_stderr(self):
+        """Copy stderr to the debug log as it arrives, flagging readiness"""
+        while line := await self.proc.stderr.readline():
+            self._log.write(line)
+            self._stderr_tail.append(line)
+            if READY_MARKER in line:
+                self._log.flush()
+                self._ready.set()
+        # EOF: wake the waiter instead of leaving it to time out
+        self._ready.set()
+
+    def drain_stderr(self):
+        """Return and forget the most recent stderr lines (debug mode only)"""
+        lines = [line.decode(errors="replace").rstrip() for line in self._stderr_tail]
+        self._stderr_tail.clear()
+        return lines
+
+    async def _read_responses(self):
+        """Split stdout into newline-delimited frames and dispatch each one"""
+        buf = bytearray()
+        while chunk := await self.proc.stdout.read(65536):
+            # Only the new bytes can hold a newline: the leftover partial
+            # frame was already scanned on the previous pass
+            scan = len(buf)
+            buf += chunk
+            start = 0
+            while (end := buf.find(b"\n", scan)) != -1:
+                self._dispatch(buf[start:end])
+                start = scan = end + 1
+            del buf[:start]
+
+        # Server closed stdout: nobody else is going to answer
+        for future in self._pending.values():
+            if not future.done():
+                future.set_result(None)
+        self._pending.clear()
+
+    def _dispatch(self, frame):
+        """Route one JSON response to the request waiting on its id"""
+        # Skip any non-JSON lines (like debug output). Frames stay as
+        # bytes: both orjson and json parse them without a str decode.
+        line = frame.strip()
+        if line.startswith(b"["):
+            print(f"[DEBUG OUTPUT] {line.decode(errors='replace')}")
+        elif line.startswith(b"{"):
+            try:
+                response = loads(line)
+            except JSONDecodeError:
+                print(f"[ERROR] Failed to parse JSON: {bytes(line[:500])!r}")
+                return
+
+            future = self._pending.pop(response.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+
+    async def send(self, request):
+        """Send a request and return its response, or None on timeout"""
+        responses = await self.send_many([request])
+        return responses[0]
+
+    async def send_many(self, requests):
+        """Pipeline requests in a single write and return responses in order
+
+        The server answers each line as it reads it, so nothing waits on a
+        round trip between requests; replies are matched back up by id.
+        """
+        return await self.send_raw([encode_request(request) for request in requests])
+
+    async def send_raw(self, frames):
+        """Like send_many, for (request_id, frame) pairs from encode_request"""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for request_id, _ in frames:
+            future = loop.create_future()
+            self._pending[request_id] = future
+            futures.append(future)
+
+        # Reuse one output buffer; the pipe transport copies whatever it
+        # cannot write immediately, so clearing it next time is safe
+        out = self._out
+        out.clear()
+        for _, frame in frames:
+            out += frame
+        self.proc.stdin.write(out)
+        await self.proc.stdin.drain()
+
+        # The server answers one request at a time, so each one also waits
+        # out everything queued ahead of it: scale its deadline to match
+        return await asyncio.gather(*[
+            self._wait(request_id, future, self.request_timeout * position)
+            for position, ((request_id, _), future) in enumerate(zip(frames, futures), start=1)
+        ])
+
+    async def _wait(self, request_id, future, timeout):
+        """Await one response, or None once its timeout passes"""
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            self._pending.pop(request_id, None)
+            return None
+
+    async def close(self):
+        """Stop the server and its reader tasks"""
+        for task in (self._stderr_task, self._reader):
+            if task is not None:
+                task.cancel()
+        if self.proc is not None:
+            if self.proc.returncode is None:
+                self.proc.terminate()
+            await self.proc.wait()
+        if self._log is not None:
+            self._log.close()
@@ -0,0 +1,120 @@
+"""
+Tests for the --persistent ServerSupervisor in verify_all_tools.py
+
+Runs against a small Python stand-in for `slunk-swift --mcp`, so no Xcode
+build is needed:
+
+    python -m unittest tests.test_supervisor
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import verify_all_tools
+from verify_all_tools import ServerSupervisor
+
+# Echoes each request's params back under its id, after an optional delay
+STUB_SERVER = """\
+import json, sys, time
+for line in sys.stdin:
+    request = json.loads(line)
+    time.sleep(request["params"].get("delay", 0))
+    print(json.dumps({"jsonrpc": "2.0", "result": request["params"], "id": request["id"]}), flush=True)
+"""
+
+def frame(request_id, **params):
+    return json.dumps({"jsonrpc": "2.0", "method": "echo", "params": params, "id": request_id}).encode() + b"\n"
+
+class ServerSupervisorTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.server = server = self.tmp / "server"
+        server.write_text(f"#!{sys.executable}\n{STUB_SERVER}")
+        server.chmod(0o755)
+        self.socket_path = self.tmp / "supervisor.sock"
+        for name, value in (("MCP_SERVER_PATH", str(server)), ("SUPERVISOR_SOCKET", self.socket_path)):
+            patcher = mock.patch.object(verify_all_tools, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(self.socket_path))
+        listener.listen()
+        # Cleanups run last-in first-out: stop the server, which ends the
+        # run loop, and join it before the listener it may re-register closes
+        self.addCleanup(listener.close)
+        self.supervisor = ServerSupervisor(listener)
+        thread = threading.Thread(target=self.supervisor.run, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(lambda: self.supervisor.proc.terminate())
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(str(self.socket_path))
+        sock.settimeout(30)
+        self.addCleanup(sock.close)
+        return sock, sock.makefile("rb")
+
+    def test_round_trip(self):
+        sock, responses = self.connect()
+        sock.sendall(frame(1, text="hello"))
+        self.assertEqual(json.loads(responses.readline()), {"jsonrpc": "2.0", "result": {"text": "hello"}, "id": 1})
+
+    def test_drops_responses_owed_to_a_departed_client(self):
+        sock, responses = self.connect()
+        sock.sendall(frame(1, delay=0.2) + frame(2, delay=0.2))
+        # The makefile holds the socket open until it is closed too
+        responses.close()
+        sock.close()
+        # Let the supervisor see the disconnect before the next client
+        time.sleep(0.05)
+
+        sock, responses = self.connect()
+        sock.sendall(frame(3))
+        self.assertEqual(json.loads(responses.readline())["id"], 3)
+
+    def test_restarts_a_rebuilt_server(self):
+        sock, responses = self.connect()
+        sock.sendall(frame(1))
+        responses.readline()
+        old = self.supervisor.proc
+        responses.close()
+        sock.close()
+        # Looks like a fresh build to the next _accept
+        os.utime(self.server, (time.time() + 60,) * 2)
+
+        sock, responses = self.connect()
+        sock.sendall(frame(2))
+        self.assertEqual(json.loads(responses.readline())["id"], 2)
+        self.assertIsNot(self.supervisor.proc, old)
+        self.assertTrue(old.stdin.closed and old.stdout.closed)
+
+    def test_server_blocked_on_output_does_not_stall_forwarding(self):
+        # Far more than both pipe buffers in each direction: with inline
+        # writes to stdin, server and supervisor would wait on each other
+        count = 200
+        padding = "x" * 65536
+        sock, responses = self.connect()
+        sender = threading.Thread(
+            target=sock.sendall,
+            args=(b"".join(frame(i, padding=padding) for i in range(count)),),
+            daemon=True
+        )
+        sender.start()
+        ids = [json.loads(responses.readline())["id"] for _ in range(count)]
+        sender.join(5)
+        self.assertEqual(ids, list(range(count)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,213 +1,703 @@
 #!/usr/bin/env python3
 """Comprehensive verification of all MCP tools"""
 
+import argparse
+import collections
 import subprocess
-import json
+import hashlib
+import os
+import re
+import selectors
+import socket
+import tempfile
+import threading
 import time
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from slunk_mcp_client import MCP_SERVER_PATH, JSONDecodeError, dumps, loads
+
+# tools/list results, cached per server binary build
+HANDSHAKE_CACHE_DIR = Path.home() / ".cache" / "slunk-mcp" / "verify"
+
+# --persistent: where the supervisor listens, and how long it keeps the
+# server alive with no client connected
+SUPERVISOR_SOCKET = Path(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()) / "slunk-verify.sock"
+SUPERVISOR_IDLE_TIMEOUT = 10 * 60
+
+# A response's JSON-RPC id. The server writes it after the result, so the
+# last `"id"` key in a frame is the top-level one.
+ID_RE = re.compile(rb'"id"\s*:\s*(\d+)')
+
+# Frames nobody was waiting for, shown when a tool times out
+UNCLAIMED_FRAMES = 32
+
+# Most recent server stderr reads kept for post-mortem output
+STDERR_CHUNKS = 64
+
+# How often the reader thread checks whether the server is still running
+POLL_INTERVAL = 1.0
+
+class ServerDiedError(RuntimeError):
+    """The server exited or closed its output with requests outstanding"""
+
+# Fixed parts of every request frame; only method, params and id vary
+ENVELOPE_PREFIX = b'{"jsonrpc":"2.0","method":"'
+ENVELOPE_PARAMS = b'","params":'
+ENVELOPE_ID = b',"id":'
+ENVELOPE_SUFFIX = b'}\n'
+
+@dataclass(frozen=True, slots=True)
+class ToolTest:
+    """One tools/call to verify"""
+    name: str
+    params: dict
+    description: str
+    # tools/call params, serialized once when the test is defined
+    call_params: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "call_params", dumps({"name": self.name, "arguments": self.params}))
+
+TOOL_TESTS: tuple[ToolTest, ...] = (
+    ToolTest("searchConversations", {"query": "test message", "limit": 5}, "Natural language search"),
+    ToolTest("search_messages", {"query": "API", "channels": ["general"], "limit": 5}, "Filtered message search"),
+    ToolTest("get_thread_context", {"thread_id": "1234567890.123456", "include_context": True}, "Thread retrieval"),
+    ToolTest("get_message_context", {"message_id": "1234567890.123456", "include_thread": True}, "Message context analysis"),
+    ToolTest("parse_natural_query", {"query": "messages from john in #general yesterday", "include_entities": True}, "Query parsing"),
+    ToolTest("conversational_search", {"query": "show API discussions", "action": "search", "limit": 5}, "Conversational search"),
+    ToolTest("discover_patterns", {"time_range": "week", "pattern_type": "topics", "min_occurrences": 2}, "Pattern discovery"),
+    ToolTest("suggest_related", {"query_context": "API documentation", "suggestion_type": "similar", "limit": 5}, "Related content suggestions"),
+)
+
+def encode_frame(method, params, request_id):
+    """Encode one request frame by splicing into the fixed envelope
+
+    Methods are plain ASCII JSON-RPC names, so they need no escaping.
+    `params` may already be encoded JSON bytes. Requests without params
+    go through a full dumps of the envelope.
+    """
+    if params is None:
+        return dumps({
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": {},
+            "id": request_id
+        }) + b'\n'
+    return b''.join((
+        ENVELOPE_PREFIX, method.encode(),
+        ENVELOPE_PARAMS, params if isinstance(params, bytes) else dumps(params),
+        ENVELOPE_ID, str(request_id).encode(),
+        ENVELOPE_SUFFIX
+    ))
 
 class MCPToolVerifier:
-    def __init__(self):
+    def __init__(self, stream=0, persistent=False):
         self.proc = None
+        self.persistent = persistent
+        self._sock = None
+        # Where requests are written and responses read: the server's
+        # stdin/stdout, or both ends of the supervisor socket
+        self._wfd = None
+        self._rfd = None
+        self.init_response = None
         self.test_results = {}
+        self._selector = None
+        self._buf = bytearray()
+        # Futures for requests in flight, keyed by JSON-RPC id; the reader
+        # thread resolves each one when its response arrives
+        self._pending = {}
+        self._unclaimed = collections.deque(maxlen=UNCLAIMED_FRAMES)
+        self._stderr_fd = None
+        self._stderr_tail = collections.deque(maxlen=STDERR_CHUNKS)
+        self._reader = None
+        self._dead = None
+        self._write_lock = threading.Lock()
+        # Output is collected here and written in one go by flush();
+        # with stream=N it goes out every N lines instead
+        self._log: list[str] = []
+        self.stream = stream
         
-    def start_server(self):
-        """Start the MCP server"""
-        print("Starting MCP server...")
-        self.proc = subprocess.Popen(
-            ['/Users/junekim/Library/Developer/Xcode/DerivedData/slunk-swift-hbeqpnnlvrrmfkftkscwaikwwclb/Build/Products/Release/slunk-swift.app/Contents/MacOS/slunk-swift', '--mcp'],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=0
-        )
-        time.sleep(3)
+    def log(self, line):
+        """Queue one line of output"""
+        self._log.append(line + "\n")
+        if self.stream and len(self._log) >= self.stream:
+            self.flush()
+            
+    def flush(self):
+        """Write every queued line to stdout with a single write"""
+        sys.stdout.write("".join(self._log))
+        sys.stdout.flush()
+        self._log.clear()
+        
+    def start_server(self, timeout=10):
+        """Start the MCP server and wait until it answers initialize"""
+        if self.persistent:
+            self.log(f"Connecting to persistent MCP server at {SUPERVISOR_SOCKET}...")
+            self._connect_supervisor()
+        else:
+            self.log("Starting MCP server...")
+            self.proc = subprocess.Popen(
+                [MCP_SERVER_PATH, '--mcp'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0
+            )
+            self._wfd = self.proc.stdin.fileno()
+            self._rfd = self.proc.stdout.fileno()
+            self._stderr_fd = self.proc.stderr.fileno()
+            # Read stdout and stderr with os.read under a selector so
+            # timeouts are real and a chatty server never blocks on stderr
+            os.set_blocking(self._rfd, False)
+            os.set_blocking(self._stderr_fd, False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._rfd, selectors.EVENT_READ)
+        if self._stderr_fd is not None:
+            self._selector.register(self._stderr_fd, selectors.EVENT_READ)
+        self._reader = threading.Thread(target=self._read_responses, name="mcp-reader", daemon=True)
+        self._reader.start()
+        
+        # Send initialize once instead of sleeping for a fixed time: the pipe
+        # holds it until the server's read loop starts, so the answer doubles
+        # as the readiness signal. Wait in short slices so a server that
+        # dies in the meantime fails fast.
+        try:
+            [future] = self.send_batch([("initialize", None, 0)])
+        except (BrokenPipeError, ConnectionResetError):
+            self._server_failed("closed its input")
+        deadline = time.monotonic() + timeout
+        while (response := self._wait(future, timeout=0.2)) is None:
+            if self.proc is not None and self.proc.poll() is not None:
+                self._server_failed(f"exited with status {self.proc.returncode}")
+            if self._dead:
+                raise self._dead
+            if time.monotonic() >= deadline:
+                self._server_failed(f"did not answer initialize within {timeout}s")
+        if 'result' not in response:
+            self._server_failed(f"rejected initialize: {response.get('error')}")
+        self.init_response = response
+        
+    def _server_failed(self, reason):
+        """Abort startup, including whatever the server logged to stderr"""
+        raise RuntimeError(f"MCP server {reason}\n{self._read_stderr()}")
+        
+    def _connect_supervisor(self):
+        """Connect to the persistent server, starting its supervisor if needed"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(SUPERVISOR_SOCKET))
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Nobody listening (or a stale socket left by a crash). Use a
+            # fresh socket: the forked supervisor must not share this one.
+            sock.close()
+            spawn_supervisor()
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(str(SUPERVISOR_SOCKET))
+        self._sock = sock
+        self._wfd = self._rfd = sock.fileno()
+        
+    def _read_stderr(self, limit=2000):
+        """Return the tail of what the server has written to stderr"""
+        if self.proc is None:
+            return "(stderr of the persistent server is not captured)"
+        return b"".join(self._stderr_tail)[-limit:].decode(errors="replace")
         
     def send_request(self, method, params=None, request_id=1):
         """Send a request and get response"""
-        request = json.dumps({
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params or {},
-            "id": request_id
-        })
-        
-        self.proc.stdin.write(request + '\n')
-        self.proc.stdin.flush()
-        
-        # Wait for response
-        start_time = time.time()
-        while time.time() - start_time < 10:  # 10 second timeout
-            line = self.proc.stdout.readline()
-            if line:
-                try:
-                    return json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-        return None
-        
-    def verify_tool(self, tool_name, test_params):
-        """Verify a single tool"""
-        print(f"\n📋 Testing {tool_name}...")
+        [future] = self.send_batch([(method, params, request_id)])
+        return self._wait(future)
+
+    def send_batch(self, requests):
+        """Write (method, params, request_id) requests with a single writev
+
+        Returns one Future per request, resolved with its response by the
+        reader thread, or failed with ServerDiedError if the server goes
+        away first. Raises ServerDiedError if it is already gone.
+        """
+        futures = []
+        buffers = []
+        for method, params, request_id in requests:
+            # Register before writing so a fast reply always finds its future
+            self._pending[request_id] = future = Future()
+            futures.append(future)
+            buffers.append(encode_frame(method, params, request_id))
+        # Checked after registering: either the reader sees these futures
+        # when it fails the pending ones, or we see that it already has
+        if self._dead:
+            raise self._dead
+        with self._write_lock:
+            self._writev(buffers)
+        return futures
+
+    def _writev(self, buffers):
+        """Write every buffer to stdin, resubmitting the rest after a short write"""
+        fd = self._wfd
+        iov = [memoryview(b) for b in buffers]
+        while iov:
+            written = os.writev(fd, iov)
+            while iov and written >= len(iov[0]):
+                written -= len(iov.pop(0))
+            if iov:
+                iov[0] = iov[0][written:]
+
+    def _wait(self, future, timeout=10):
+        """Return a request's response, or None if it does not arrive in time"""
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return None
+
+    def _read_responses(self):
+        """Reader thread: read responses until EOF, resolving futures by id
+
+        Server stderr is read by the same loop and only its recent chunks
+        are kept, in self._stderr_tail.
+        """
+        while True:
+            ready = {key.fd for key, _ in self._selector.select(timeout=POLL_INTERVAL)}
+            if self._stderr_fd in ready:
+                self._read_stderr_chunk()
+            if self._rfd not in ready:
+                # An exited server may still hold the pipe open through a
+                # child, so check on it directly; keep anything it wrote
+                if self.proc is not None and self.proc.poll() is not None:
+                    while self._read_chunk():
+                        pass
+                    break
+                continue
+            if self._read_chunk() is False:
+                break
+        while self._read_stderr_chunk():
+            pass
+        self._server_died()
+
+    def _read_chunk(self):
+        """Read and dispatch pending responses
+
+        Returns True after reading, None if nothing was ready, False at EOF.
+        """
+        try:
+            chunk = os.read(self._rfd, 65536)
+        except BlockingIOError:
+            return None
+        except ConnectionResetError:
+            return False
+        if not chunk:
+            return False
+        self._buf += chunk
+        self._parse_lines()
+        return True
+
+    def _read_stderr_chunk(self):
+        """Keep one pending read of stderr; False at EOF or when drained"""
+        if self._stderr_fd is None:
+            return False
+        try:
+            chunk = os.read(self._stderr_fd, 65536)
+        except BlockingIOError:
+            return False
+        if not chunk:
+            self._selector.unregister(self._stderr_fd)
+            self._stderr_fd = None
+            return False
+        self._stderr_tail.append(chunk)
+        return True
+
+    def _server_died(self):
+        """Fail every outstanding request: nobody else is going to answer"""
+        status = ""
+        if self.proc is not None:
+            try:
+                status = f" with status {self.proc.wait(timeout=1)}"
+            except subprocess.TimeoutExpired:
+                pass
+        self._dead = ServerDiedError(f"MCP server exited{status}\n{self._read_stderr()}")
+        for request_id in list(self._pending):
+            future = self._pending.pop(request_id, None)
+            if future is not None and not future.done():
+                future.set_exception(self._dead)
+
+    def _parse_lines(self):
+        """Hand each complete line in the buffer to the future awaiting its id
+
+        Only frames whose id someone is waiting for are parsed; the rest
+        (notifications, late replies) go to self._unclaimed unparsed.
+        """
+        start = 0
+        while (end := self._buf.find(b'\n', start)) != -1:
+            line = self._buf[start:end].strip()
+            start = end + 1
+            if not line.startswith(b'{'):
+                continue
+            match = ID_RE.match(line, line.rfind(b'"id"'))
+            if match is None or int(match[1]) not in self._pending:
+                self._unclaimed.append(bytes(line))
+                continue
+            try:
+                response = loads(line)
+            except JSONDecodeError:
+                continue
+            future = self._pending.pop(response.get('id'), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+        del self._buf[:start]
         
-        response = self.send_request("tools/call", {
-            "name": tool_name,
-            "arguments": test_params
-        })
+    def verify_tool(self, tool_name, future, timeout=10):
+        """Wait for one tool's response and classify it
+
+        Returns (result, lines) rather than logging, since workers finish
+        in whatever order and the report should not.
+        """
+        header = f"\n📋 Testing {tool_name}..."
+        try:
+            response = self._wait(future, timeout)
+        except ServerDiedError:
+            return "SERVER_DIED", [header, "  ❌ Server exited before responding"]
+        result, line = self._classify(response)
+        return result, [header, line]
         
+    def _classify(self, response):
+        """Classify one tool's response as (result, report line)"""
         if response is None:
-            print(f"  ❌ No response received")
-            self.test_results[tool_name] = "TIMEOUT"
-            return False
+            return "TIMEOUT", "  ❌ No response received"
             
         if 'error' in response:
-            error_msg = response['error'].get('message', 'Unknown error')
-            print(f"  ❌ Error: {error_msg}")
-            self.test_results[tool_name] = f"ERROR: {error_msg}"
-            return False
+            error_msg = response['error']['message']
+            return f"ERROR: {error_msg}", f"  ❌ Error: {error_msg}"
             
-        if 'result' in response:
-            # Check if we got content
-            content = response['result'].get('content', [])
-            if content and len(content) > 0:
-                text = content[0].get('text', '')
-                if text:
-                    # Show first 100 chars
-                    preview = text[:100] + "..." if len(text) > 100 else text
-                    print(f"  ✅ Success! Response preview: {preview}")
-                    self.test_results[tool_name] = "SUCCESS"
-                    return True
-                else:
-                    print(f"  ⚠️  Empty response content")
-                    self.test_results[tool_name] = "EMPTY_RESPONSE"
-            else:
-                print(f"  ⚠️  No content in response")
-                self.test_results[tool_name] = "NO_CONTENT"
-                
-        return False
+        try:
+            text = response['result']['content'][0]['text']
+        except (TypeError, KeyError, IndexError):
+            return "NO_CONTENT", "  ⚠️  No content in response"
+            
+        if not text:
+            return "EMPTY_RESPONSE", "  ⚠️  Empty response content"
+            
+        # Show first 100 chars; probing one char past the cut
+        # avoids a len() over multi-megabyte results
+        preview = text[:100] + ("..." if text[100:101] else "")
+        return "SUCCESS", f"  ✅ Success! Response preview: {preview}"
+        
+    def _tools_cache_path(self):
+        """Cache file for the current server binary, keyed by path and mtime"""
+        key = f"{MCP_SERVER_PATH}:{os.path.getmtime(MCP_SERVER_PATH)}"
+        return HANDSHAKE_CACHE_DIR / f"{hashlib.blake2b(key.encode()).hexdigest()}.json"
+        
+    def _load_tools(self):
+        """Return the cached tools/list result for this binary, if any"""
+        try:
+            return loads(self._tools_cache_path().read_bytes())['tools']
+        except (OSError, JSONDecodeError, KeyError, TypeError):
+            return None
+            
+    def _save_tools(self, tools):
+        """Cache the tool list so later runs can skip tools/list"""
+        path = self._tools_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(dumps({"tools": tools}))
         
     def run_all_tests(self):
         """Run all tool tests"""
-        print("\n" + "="*60)
-        print("MCP TOOL VERIFICATION")
-        print("="*60)
+        self.log("\n" + "="*60)
+        self.log("MCP TOOL VERIFICATION")
+        self.log("="*60)
         
+        # 1. Initialize: start_server only returns once this has succeeded
         self.start_server()
+        self.log("\n1️⃣  Initializing MCP server...")
+        server_info = self.init_response['result']['serverInfo']
+        self.log(f"  ✅ Server: {server_info['name']} v{server_info['version']}")
         
-        # 1. Initialize
-        print("\n1️⃣  Initializing MCP server...")
-        init_response = self.send_request("initialize")
-        if init_response and 'result' in init_response:
-            server_info = init_response['result']['serverInfo']
-            print(f"  ✅ Server: {server_info['name']} v{server_info['version']}")
-        else:
-            print("  ❌ Failed to initialize!")
-            return
-            
-        # 2. List tools
-        print("\n2️⃣  Listing available tools...")
-        tools_response = self.send_request("tools/list", {}, 2)
-        if tools_response and 'result' in tools_response:
-            tools = tools_response['result']['tools']
-            print(f"  ✅ Found {len(tools)} tools")
-            for i, tool in enumerate(tools, 1):
-                print(f"     {i}. {tool['name']}")
+        tools = self._load_tools()
+        wanted = {test.name for test in TOOL_TESTS}
+        if tools and wanted <= {tool['name'] for tool in tools}:
+            # Same binary as a previous run: skip the tools/list round trip
+            self.log("\n2️⃣  Using cached tools/list (server binary unchanged)")
+            self.log(f"  ✅ Found {len(tools)} tools")
         else:
-            print("  ❌ Failed to list tools!")
-            return
+            # 2. List tools
+            self.log("\n2️⃣  Listing available tools...")
+            tools_response = self.send_request("tools/list", {}, 2)
+            if tools_response and 'result' in tools_response:
+                tools = tools_response['result']['tools']
+                self.log(f"  ✅ Found {len(tools)} tools")
+                for i, tool in enumerate(tools, 1):
+                    self.log(f"     {i}. {tool['name']}")
+            else:
+                self.log("  ❌ Failed to list tools!")
+                return
+            self._save_tools(tools)
             
         # 3. Test each tool
-        print("\n3️⃣  Testing each tool...")
-        
-        tool_tests = [
-            {
-                "name": "searchConversations",
-                "params": {"query": "test message", "limit": 5},
-                "description": "Natural language search"
-            },
-            {
-                "name": "search_messages", 
-                "params": {"query": "API", "channels": ["general"], "limit": 5},
-                "description": "Filtered message search"
-            },
-            {
-                "name": "get_thread_context",
-                "params": {"thread_id": "1234567890.123456", "include_context": True},
-                "description": "Thread retrieval"
-            },
-            {
-                "name": "get_message_context",
-                "params": {"message_id": "1234567890.123456", "include_thread": True},
-                "description": "Message context analysis"
-            },
-            {
-                "name": "parse_natural_query",
-                "params": {"query": "messages from john in #general yesterday", "include_entities": True},
-                "description": "Query parsing"
-            },
-            {
-                "name": "conversational_search",
-                "params": {"query": "show API discussions", "action": "search", "limit": 5},
-                "description": "Conversational search"
-            },
-            {
-                "name": "discover_patterns",
-                "params": {"time_range": "week", "pattern_type": "topics", "min_occurrences": 2},
-                "description": "Pattern discovery"
-            },
-            {
-                "name": "suggest_related",
-                "params": {"query_context": "API documentation", "suggestion_type": "similar", "limit": 5},
-                "description": "Related content suggestions"
-            }
-        ]
-        
-        for i, test in enumerate(tool_tests, 3):
-            self.verify_tool(test['name'], test['params'])
+        self.log("\n3️⃣  Testing each tool...")
+        
+        # Submit every call up front; the server answers them in order and
+        # the reader thread matches the responses back up by id. Each one
+        # is classified as soon as it lands, while the server is still
+        # working on the rest. A call queues behind every call ahead of
+        # it, so its timeout grows with its position in the batch.
+        try:
+            futures = self.send_batch([
+                ("tools/call", test.call_params, i)
+                for i, test in enumerate(TOOL_TESTS, start=3)
+            ])
+        except ServerDiedError as e:
+            self.log(f"\n❌ {e}")
+            for test in TOOL_TESTS:
+                self.test_results[test.name] = "SERVER_DIED"
+            return
+        with ThreadPoolExecutor(max_workers=len(TOOL_TESTS)) as pool:
+            outcomes = list(pool.map(
+                self.verify_tool,
+                [test.name for test in TOOL_TESTS],
+                futures,
+                [10 * position for position in range(1, len(TOOL_TESTS) + 1)]
+            ))
+        
+        # Report in TOOL_TESTS order, whatever order the workers finished in
+        for test, (result, lines) in zip(TOOL_TESTS, outcomes):
+            for line in lines:
+                self.log(line)
+            self.test_results[test.name] = result
+        if self._dead and "SERVER_DIED" in self.test_results.values():
+            # Every unanswered call failed at once; say why just once
+            self.log(f"\n❌ {self._dead}")
+        if "TIMEOUT" in self.test_results.values() and self._unclaimed:
+            # A reply under an unexpected id would look like a timeout
+            self.log(f"\n⚠️  Frames no request was waiting for (last {UNCLAIMED_FRAMES}):")
+            for line in list(self._unclaimed):
+                self.log(f"     {line[:200].decode(errors='replace')}")
             
     def print_summary(self):
         """Print test summary"""
-        print("\n" + "="*60)
-        print("TEST SUMMARY")
-        print("="*60)
+        self.log("\n" + "="*60)
+        self.log("TEST SUMMARY")
+        self.log("="*60)
         
         success_count = sum(1 for result in self.test_results.values() if result == "SUCCESS")
         total_count = len(self.test_results)
         
-        print(f"\nTotal tools tested: {total_count}")
-        print(f"Successful: {success_count}")
-        print(f"Failed: {total_count - success_count}")
+        self.log(f"\nTotal tools tested: {total_count}")
+        self.log(f"Successful: {success_count}")
+        self.log(f"Failed: {total_count - success_count}")
         
-        print("\nDetailed results:")
+        self.log("\nDetailed results:")
         for tool, result in self.test_results.items():
             status = "✅" if result == "SUCCESS" else "❌"
-            print(f"  {status} {tool}: {result}")
+            self.log(f"  {status} {tool}: {result}")
             
-        print("\n" + "="*60)
+        self.log("\n" + "="*60)
         
         if success_count == total_count:
-            print("🎉 ALL TOOLS VERIFIED SUCCESSFULLY!")
+            self.log("🎉 ALL TOOLS VERIFIED SUCCESSFULLY!")
         else:
-            print(f"⚠️  {total_count - success_count} tools need attention")
+            self.log(f"⚠️  {total_count - success_count} tools need attention")
             
-        print("="*60)
+        self.log("="*60)
         
     def cleanup(self):
         """Cleanup server process"""
+        if self._sock:
+            # Leave the persistent server running for the next run. Only
+            # close: shutdown() raises ENOTCONN on macOS once the peer is gone.
+            self._sock.close()
         if self.proc:
             self.proc.terminate()
             self.proc.wait()
 
-def main():
-    verifier = MCPToolVerifier()
+def spawn_supervisor():
+    """Fork a detached ServerSupervisor listening on SUPERVISOR_SOCKET
+
+    The socket is bound before forking, so the caller can connect as soon
+    as this returns; the connection waits in the backlog until accepted.
+    """
+    SUPERVISOR_SOCKET.unlink(missing_ok=True)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(SUPERVISOR_SOCKET))
+    listener.listen()
+    sys.stdout.flush()
+    if os.fork() == 0:
+        try:
+            os.setsid()
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for fd in (0, 1, 2):
+                os.dup2(devnull, fd)
+            ServerSupervisor(listener).run()
+        finally:
+            os._exit(0)
+    listener.close()
+
+class ServerSupervisor:
+    """Owns one `slunk-swift --mcp` process and lends it to socket clients
+
+    Clients are served one at a time; frames are shuttled unchanged in
+    both directions. The server answers in order, so when a client leaves
+    with requests still in flight, that many responses are dropped before
+    the next client sees any. Client bytes are queued and written to the
+    server only when its stdin is writable, so a server blocked on its own
+    output never stalls the loop that would drain it. Exits when the
+    server does, or after SUPERVISOR_IDLE_TIMEOUT with no client.
+    """
+
+    def __init__(self, listener, idle_timeout=SUPERVISOR_IDLE_TIMEOUT):
+        self.listener = listener
+        self.idle_timeout = idle_timeout
+        self.proc = None
+        self.mtime = None
+        self.client = None
+        self.selector = selectors.DefaultSelector()
+        self._buf = bytearray()
+        # Client bytes not yet accepted by the server's stdin
+        self._to_server = bytearray()
+        self._in_flight = 0
+        self._stale = 0
+
+    def run(self):
+        self._spawn()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        idle_since = time.monotonic()
+        try:
+            while True:
+                events = self.selector.select(timeout=60)
+                if self.client is None and time.monotonic() - idle_since > self.idle_timeout:
+                    return
+                for key, _ in events:
+                    if key.fileobj is self.listener:
+                        self._accept()
+                    elif key.fileobj is self.client:
+                        if not self._from_client():
+                            idle_since = time.monotonic()
+                    elif key.fileobj is self.proc.stdin:
+                        self._to_server_ready()
+                    elif not self._from_server():
+                        return
+        finally:
+            if SUPERVISOR_SOCKET.exists():
+                SUPERVISOR_SOCKET.unlink()
+            if self.client is not None:
+                self.client.close()
+            self.selector.close()
+            self._stop_server()
+
+    def _spawn(self):
+        """Start the server; stderr is discarded since nobody reads it"""
+        self.mtime = os.path.getmtime(MCP_SERVER_PATH)
+        self.proc = subprocess.Popen(
+            [MCP_SERVER_PATH, '--mcp'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+        os.set_blocking(self.proc.stdin.fileno(), False)
+        self._buf.clear()
+        self._to_server.clear()
+        self._in_flight = self._stale = 0
+        self.selector.register(self.proc.stdout, selectors.EVENT_READ)
+
+    def _accept(self):
+        """Take the next client, restarting the server if it was rebuilt"""
+        self.client, _ = self.listener.accept()
+        self.selector.unregister(self.listener)
+        self.selector.register(self.client, selectors.EVENT_READ)
+        if os.path.getmtime(MCP_SERVER_PATH) != self.mtime:
+            self.selector.unregister(self.proc.stdout)
+            if self._to_server:
+                self.selector.unregister(self.proc.stdin)
+            self._stop_server()
+            self._spawn()
+
+    def _stop_server(self):
+        """Terminate the server if it is still running and close its pipes"""
+        if self.proc.poll() is None:
+            self.proc.terminate()
+            self.proc.wait()
+        # The supervisor outlives many rebuilds; don't leak two fds each
+        self.proc.stdin.close()
+        self.proc.stdout.close()
+
+    def _from_client(self):
+        """Forward client bytes to the server; False once the client leaves"""
+        try:
+            data = self.client.recv(65536)
+        except ConnectionResetError:
+            data = b''
+        if not data:
+            self.selector.unregister(self.client)
+            self.client.close()
+            self.client = None
+            self.selector.register(self.listener, selectors.EVENT_READ)
+            self._stale += self._in_flight
+            self._in_flight = 0
+            return False
+        self._in_flight += data.count(b'\n')
+        if not self._to_server:
+            self.selector.register(self.proc.stdin, selectors.EVENT_WRITE)
+        self._to_server += data
+        return True
+
+    def _to_server_ready(self):
+        """Write as much queued client data as the server's stdin takes"""
+        try:
+            written = os.write(self.proc.stdin.fileno(), self._to_server)
+        except BlockingIOError:
+            return
+        except BrokenPipeError:
+            # Server is gone; its stdout EOF ends the run
+            written = len(self._to_server)
+        del self._to_server[:written]
+        if not self._to_server:
+            self.selector.unregister(self.proc.stdin)
+
+    def _from_server(self):
+        """Forward complete response lines to the client; False at EOF"""
+        chunk = os.read(self.proc.stdout.fileno(), 65536)
+        if not chunk:
+            return False
+        self._buf += chunk
+        out = bytearray()
+        start = 0
+        while (end := self._buf.find(b'\n', start)) != -1:
+            line = self._buf[start:end + 1]
+            start = end + 1
+            if line.startswith(b'{'):
+                if self._stale:
+                    # Answer to a request from a client that already left
+                    self._stale -= 1
+                    continue
+                self._in_flight = max(self._in_flight - 1, 0)
+            out += line
+        del self._buf[:start]
+        if out and self.client is not None:
+            try:
+                self.client.sendall(out)
+            except OSError:
+                pass
+        return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stream", type=int, nargs="?", const=1, default=0, metavar="N",
+                        help="write progress every N lines (default 1) instead of all at the end")
+    parser.add_argument("--persistent", action="store_true",
+                        help=f"reuse one server across runs through a supervisor at {SUPERVISOR_SOCKET}")
+    args = parser.parse_args(argv)
+    
+    verifier = MCPToolVerifier(stream=args.stream, persistent=args.persistent)
     try:
         verifier.run_all_tests()
         verifier.print_summary()
     except Exception as e:
-        print(f"\n❌ Error during testing: {e}")
+        verifier.log(f"\n❌ Error during testing: {e}")
     finally:
-        verifier.cleanup()
+        # Flush even if cleanup fails, or the whole buffered run is lost
+        try:
+            verifier.cleanup()
+        finally:
+            verifier.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file